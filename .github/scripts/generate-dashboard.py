@@ -6,168 +6,56 @@ This script generates an HTML dashboard for visualizing requirement compliance s
 """
 
 import argparse
+import html
 import sys
 from pathlib import Path
+from typing import Final, TextIO
 from datetime import datetime
 import json
 import re
 
-class DashboardGenerator:
-    """Generates HTML dashboard from compliance reports."""
-    
-    def __init__(self):
-        self.compliance_data = {}
-    
-    def parse_compliance_report(self, report_file: Path) -> None:
-        """Parse the compliance report markdown file."""
-        content = report_file.read_text()
-        
-        # Extract key metrics
-        self.compliance_data = {
-            'timestamp': self._extract_timestamp(content),
-            'overall_status': self._extract_overall_status(content),
-            'summary': self._extract_summary(content),
-            'categories': self._extract_categories(content),
-            'risks': self._extract_risks(content),
-            'recommendations': self._extract_recommendations(content)
-        }
-    
-    def _extract_timestamp(self, content: str) -> str:
-        """Extract timestamp from report."""
-        match = re.search(r'\*\*Generated\*\*:\s*([^\n]+)', content)
-        return match.group(1) if match else datetime.now().isoformat()
-    
-    def _extract_overall_status(self, content: str) -> str:
-        """Extract overall status from report."""
-        match = re.search(r'\*\*Overall Status\*\*:\s*([^\n]+)', content)
-        return match.group(1) if match else 'UNKNOWN'
-    
-    def _extract_summary(self, content: str) -> dict:
-        """Extract summary statistics from report."""
-        summary = {}
-        
-        patterns = {
-            'total_requirements': r'Total Requirements\*\*:\s*(\d+)',
-            'implemented': r'Implemented\*\*:\s*(\d+)',
-            'verified': r'Verified\*\*:\s*(\d+)',
-            'planned': r'Planned\*\*:\s*(\d+)',
-            'not_started': r'Not Started\*\*:\s*(\d+)'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, content)
-            summary[key] = int(match.group(1)) if match else 0
-        
-        return summary
-    
-    def _extract_categories(self, content: str) -> dict:
-        """Extract category compliance information."""
-        categories = {}
-        
-        # Find the "Compliance by Category" section
-        category_section = re.search(r'## Compliance by Category\s*\n\n(.*?)(?=##|$)', content, re.DOTALL)
-        if not category_section:
-            return categories
-        
-        section_content = category_section.group(1)
-        
-        # Extract each category
-        category_pattern = r'### (\w+) Requirements ([^#]*?)(?=###|$)'
-        matches = re.findall(category_pattern, section_content, re.DOTALL)
-        
-        for match in matches:
-            category_name = match[0].lower()
-            category_content = match[1]
-            
-            status_match = re.search(r'\*\*Status\*\*:\s*([^\n]+)', category_content)
-            details_match = re.search(r'\*\*Details\*\*:\s*([^\n]+)', category_content)
-            
-            categories[category_name] = {
-                'status': status_match.group(1) if status_match else 'UNKNOWN',
-                'details': details_match.group(1) if details_match else ''
-            }
-        
-        return categories
-    
-    def _extract_risks(self, content: str) -> list:
-        """Extract risk information from report."""
-        risks = []
-        
-        # Find the "Risk Assessment" section
-        risk_section = re.search(r'## Risk Assessment\s*\n\n(.*?)(?=##|$)', content, re.DOTALL)
-        if not risk_section:
-            return risks
-        
-        section_content = risk_section.group(1)
-        
-        # Extract each risk
-        risk_pattern = r'### ([^#]*?)\n\n\*\*Severity\*\*:\s*([^\n]+)\n\*\*Description\*\*:\s*([^\n]+)'
-        matches = re.findall(risk_pattern, section_content, re.DOTALL)
-        
-        for match in matches:
-            risks.append({
-                'title': match[0].strip(),
-                'severity': match[1].strip(),
-                'description': match[2].strip()
-            })
-        
-        return risks
-    
-    def _extract_recommendations(self, content: str) -> list:
-        """Extract recommendations from report."""
-        recommendations = []
-        
-        # Find the "Recommendations" section
-        rec_section = re.search(r'## Recommendations\s*\n\n(.*?)(?=##|$)', content, re.DOTALL)
-        if not rec_section:
-            return recommendations
-        
-        section_content = rec_section.group(1)
-        
-        # Extract numbered recommendations
-        rec_pattern = r'\d+\.\s*([^\n]+)'
-        matches = re.findall(rec_pattern, section_content)
-        
-        return matches
-    
-    def generate_dashboard(self, output_file: Path) -> None:
-        """Generate HTML dashboard."""
-        html_content = self._generate_html()
-        output_file.write_text(html_content)
-    
-    def _generate_html(self) -> str:
-        """Generate the complete HTML dashboard."""
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Requirement Compliance Dashboard</title>
-    <style>
-        {self._get_css_styles()}
-    </style>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-</head>
-<body>
-    <div class="container">
-        {self._generate_header()}
-        {self._generate_summary_cards()}
-        {self._generate_charts()}
-        {self._generate_category_details()}
-        {self._generate_risks_section()}
-        {self._generate_recommendations_section()}
-        {self._generate_footer()}
-    </div>
-    
-    <script>
-        {self._generate_javascript()}
-    </script>
-</body>
-</html>"""
-    
-    def _get_css_styles(self) -> str:
-        """Get CSS styles for the dashboard."""
-        return """
+# Summary labels in the report and the summary keys they map to
+_SUMMARY_LABELS = {
+    'Total Requirements': 'total_requirements',
+    'Implemented': 'implemented',
+    'Verified': 'verified',
+    'Planned': 'planned',
+    'Not Started': 'not_started'
+}
+
+_CATEGORY_HEADING_RE = re.compile(r'### (\w+) Requirements\b')
+
+# Card emoji per category and per category status
+_EMOJI_MAP = {
+    'functional': '⚙️',
+    'quality': '🎯',
+    'performance': '🚀',
+    'security': '🔒'
+}
+
+_STATUS_EMOJI_MAP = {
+    'PASS': '✅',
+    'FAIL': '❌',
+    'PARTIAL': '🟡',
+    'PLANNED': '📋',
+    'NOT_TESTED': '⚠️'
+}
+
+_SEVERITY_EMOJI_MAP = {
+    'high': '🔴',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
+# Category chart percentage per status (anything else charts as 25)
+_STATUS_PCT = {
+    'PASS': 100,
+    'FAIL': 0,
+    'PARTIAL': 50
+}
+
+# Static dashboard fragments
+_CSS_STYLES: Final[str] = """
         * {
             margin: 0;
             padding: 0;
@@ -330,15 +218,278 @@ class DashboardGenerator:
             font-size: 1.2em;
         }
         """
+
+_CHARTS_HTML: Final[str] = """
+        <div class="charts-grid">
+            <div class="chart-container">
+                <h3>📊 Requirements Status Distribution</h3>
+                <canvas id="statusChart" width="400" height="200"></canvas>
+            </div>
+            <div class="chart-container">
+                <h3>🎯 Category Compliance</h3>
+                <canvas id="categoryChart" width="400" height="200"></canvas>
+            </div>
+        </div>
+        """
+
+_FOOTER_HTML: Final[str] = """
+        <div class="footer">
+            <p>🤖 Generated automatically by the Tileverse Range Reader requirement verification system</p>
+        </div>
+        """
+
+# Summary cards, as (card title, summary key)
+_SUMMARY_CARDS = (
+    ('📋 Total Requirements', 'total_requirements'),
+    ('✅ Implemented', 'implemented'),
+    ('🔍 Verified', 'verified'),
+    ('📅 Planned', 'planned'),
+    ('⏸️ Not Started', 'not_started')
+)
+
+# Repeated dashboard items, filled in with str.format_map
+_SUMMARY_CARD_TMPL: Final[str] = """
+            <div class="summary-card">
+                <h3>{title}</h3>
+                <span class="number">{value}</span>
+            </div>"""
+
+_CATEGORY_CARD_TMPL: Final[str] = """
+            <div class="category-card">
+                <h3>{emoji} {name_title} Requirements {status_emoji}</h3>
+                <p><strong>Status:</strong> {status}</p>
+                <p><strong>Details:</strong> {details}</p>
+            </div>
+            """
+
+_RISK_ITEM_TMPL: Final[str] = """
+            <div class="risk-item risk-{severity}">
+                <h4>{severity_emoji} {title}</h4>
+                <p><strong>Severity:</strong> {severity_title}</p>
+                <p>{description}</p>
+            </div>
+            """
+
+_RECOMMENDATION_ITEM_TMPL: Final[str] = """
+            <div class="recommendation-item">
+                <strong>{index}.</strong> {text}
+            </div>
+            """
+
+_esc = html.escape
+
+def _prefreeze(value):
+    """Return parsed report data with every string leaf HTML-escaped."""
+    if isinstance(value, str):
+        return _esc(value)
+    if isinstance(value, dict):
+        return {key: _prefreeze(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_prefreeze(item) for item in value]
+    return value
+
+def _split_field(line: str) -> tuple:
+    """Split a '**Label**: value' line, optionally bulleted, into (label, value)."""
+    field = line[2:] if line.startswith('- ') else line
+    if not field.startswith('**'):
+        return None, None
+    label, sep, value = field[2:].partition('**:')
+    if not sep:
+        return None, None
+    return label, value.strip()
+
+class DashboardGenerator:
+    """Generates HTML dashboard from compliance reports."""
+    
+    def __init__(self):
+        self.compliance_data = {}
+        self._has_summary = False
+        self._has_categories = False
+    
+    def parse_compliance_report(self, report_file: Path) -> None:
+        """Parse the compliance report markdown file in a single pass."""
+        data = {
+            'timestamp': None,
+            'overall_status': None,
+            'summary': dict.fromkeys(_SUMMARY_LABELS.values(), 0),
+            'categories': {},
+            'risks': [],
+            'recommendations': []
+        }
+        # The category or risk currently being filled in
+        state = {'item': None}
+        
+        # Line handler per '## ' section, resolved once when the section starts
+        section_handlers = {
+            'Executive Summary': self._handle_summary_line,
+            'Summary': self._handle_summary_line,
+            'Compliance by Category': self._handle_category_line,
+            'Risk Assessment': self._handle_risk_line,
+            'Recommendations': self._handle_recommendation_line
+        }
+        handler = self._handle_field_line
+        
+        # Lines are consumed lazily from the file, never materialized as a list
+        with report_file.open() as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line:
+                    # Blank lines carry nothing for any section handler
+                    continue
+                if line.startswith('## '):
+                    handler = section_handlers.get(line[3:].strip(), self._handle_field_line)
+                    state['item'] = None
+                else:
+                    handler(line, state, data)
+        
+        if data['timestamp'] is None:
+            data['timestamp'] = datetime.now().isoformat()
+        if data['overall_status'] is None:
+            data['overall_status'] = 'UNKNOWN'
+        
+        # Escape report values once here so the HTML generators can
+        # interpolate them directly
+        self.compliance_data = _prefreeze(data)
+        
+        # Sections with nothing to show are left out of the dashboard
+        self._has_summary = any(data['summary'].values())
+        self._has_categories = bool(data['categories'])
+    
+    def _handle_field_line(self, line: str, state: dict, data: dict) -> None:
+        """Handle a top-level line: timestamp or overall status."""
+        label, value = _split_field(line)
+        if label == 'Generated':
+            if data['timestamp'] is None:
+                data['timestamp'] = value
+        elif label == 'Overall Status':
+            if data['overall_status'] is None:
+                data['overall_status'] = value
+    
+    def _handle_summary_line(self, line: str, state: dict, data: dict) -> None:
+        """Handle a '- **Label**: N' line of the fixed-format summary section."""
+        if not line.startswith('- **'):
+            return
+        label, _, rest = line[4:].partition('**:')
+        key = _SUMMARY_LABELS.get(label)
+        if key is None:
+            return
+        number = rest.strip().split(' ', 1)[0]
+        if number.isdecimal():
+            data['summary'][key] = int(number)
+    
+    def _handle_category_line(self, line: str, state: dict, data: dict) -> None:
+        """Handle a line of the "Compliance by Category" section."""
+        if line.startswith('### '):
+            # Cheap substring test before running the heading regex
+            match = _CATEGORY_HEADING_RE.match(line) if ' Requirements' in line else None
+            state['item'] = None
+            if match:
+                category = {'status': 'UNKNOWN', 'details': ''}
+                data['categories'][match.group(1).lower()] = category
+                state['item'] = category
+            return
+        
+        category = state['item']
+        if category is None:
+            return
+        
+        label, value = _split_field(line)
+        if label == 'Status':
+            category['status'] = value
+        elif label == 'Details':
+            category['details'] = value
     
-    def _generate_header(self) -> str:
-        """Generate header section."""
-        overall_status = self.compliance_data.get('overall_status', 'UNKNOWN')
-        timestamp = self.compliance_data.get('timestamp', 'Unknown')
+    def _handle_risk_line(self, line: str, state: dict, data: dict) -> None:
+        """Handle a line of the "Risk Assessment" section."""
+        if line.startswith('### '):
+            state['item'] = {'title': line[4:].strip(), 'severity': None, 'description': None}
+            return
+        
+        risk = state['item']
+        if risk is None:
+            return
+        
+        label, value = _split_field(line)
+        if label == 'Severity':
+            risk['severity'] = value
+            # Re-cased here, on the raw text: title() would mangle escaped entities
+            risk['severity_title'] = value.title()
+        elif label == 'Description' and risk['severity'] is not None:
+            risk['description'] = value
+            data['risks'].append(risk)
+            state['item'] = None
+    
+    def _handle_recommendation_line(self, line: str, state: dict, data: dict) -> None:
+        """Handle a line of the "Recommendations" section."""
+        item = line.lstrip()
+        if not item[:1].isdecimal():
+            return
+        number, sep, text = item.partition('.')
+        text = text.lstrip()
+        if sep and number.isdecimal() and text:
+            data['recommendations'].append(text)
+    
+    def generate_dashboard(self, output_file: Path) -> None:
+        """Generate HTML dashboard."""
+        with output_file.open('w', encoding='utf-8', buffering=1 << 16) as f:
+            self._generate_html(f)
+    
+    def _generate_html(self, out: TextIO) -> None:
+        """Write the complete HTML dashboard."""
+        out.write(f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Requirement Compliance Dashboard</title>
+    <style>
+        {_CSS_STYLES}
+    </style>""")
+        # Charts, and the Chart.js library they need, only when there is data to plot
+        has_charts = self._has_summary or self._has_categories
+        if has_charts:
+            out.write("""
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>""")
+        out.write("""
+</head>
+<body>
+    <div class="container">""")
+        sections = [self._generate_header, self._generate_summary_cards]
+        if has_charts:
+            sections.append(self._generate_charts)
+        if self._has_categories:
+            sections.append(self._generate_category_details)
+        sections += (
+            self._generate_risks_section,
+            self._generate_recommendations_section,
+            self._generate_footer
+        )
+        for generate_section in sections:
+            out.write("\n        ")
+            generate_section(out)
+        out.write("""
+    </div>
+    """)
+        if has_charts:
+            out.write("""
+    <script>
+        """)
+            self._generate_javascript(out)
+            out.write("""
+    </script>""")
+        out.write("""
+</body>
+</html>""")
+    
+    def _generate_header(self, out: TextIO) -> None:
+        """Write header section."""
+        data = self.compliance_data
+        overall_status = data.get('overall_status', 'UNKNOWN')
+        timestamp = data.get('timestamp', 'Unknown')
         
         status_class = f"status-{overall_status.lower()}"
         
-        return f"""
+        out.write(f"""
         <div class="header">
             <h1>🎯 Requirement Compliance Dashboard</h1>
             <p>Last Updated: {timestamp}</p>
@@ -346,188 +497,137 @@ class DashboardGenerator:
                 Overall Status: {overall_status}
             </div>
         </div>
-        """
+        """)
     
-    def _generate_summary_cards(self) -> str:
-        """Generate summary cards section."""
-        summary = self.compliance_data.get('summary', {})
-        
-        return f"""
-        <div class="summary-grid">
-            <div class="summary-card">
-                <h3>📋 Total Requirements</h3>
-                <span class="number">{summary.get('total_requirements', 0)}</span>
-            </div>
-            <div class="summary-card">
-                <h3>✅ Implemented</h3>
-                <span class="number">{summary.get('implemented', 0)}</span>
-            </div>
-            <div class="summary-card">
-                <h3>🔍 Verified</h3>
-                <span class="number">{summary.get('verified', 0)}</span>
-            </div>
-            <div class="summary-card">
-                <h3>📅 Planned</h3>
-                <span class="number">{summary.get('planned', 0)}</span>
-            </div>
-            <div class="summary-card">
-                <h3>⏸️ Not Started</h3>
-                <span class="number">{summary.get('not_started', 0)}</span>
-            </div>
+    def _generate_summary_cards(self, out: TextIO) -> None:
+        """Write summary cards section."""
+        count = self.compliance_data.get('summary', {}).get
+        write = out.write
+        
+        write("""
+        <div class="summary-grid">""")
+        for title, key in _SUMMARY_CARDS:
+            write(_SUMMARY_CARD_TMPL.format_map({'title': title, 'value': count(key, 0)}))
+        write("""
         </div>
-        """
+        """)
     
-    def _generate_charts(self) -> str:
-        """Generate charts section."""
-        return """
-        <div class="charts-grid">
-            <div class="chart-container">
-                <h3>📊 Requirements Status Distribution</h3>
-                <canvas id="statusChart" width="400" height="200"></canvas>
-            </div>
-            <div class="chart-container">
-                <h3>🎯 Category Compliance</h3>
-                <canvas id="categoryChart" width="400" height="200"></canvas>
-            </div>
-        </div>
-        """
+    def _generate_charts(self, out: TextIO) -> None:
+        """Write charts section."""
+        out.write(_CHARTS_HTML)
     
-    def _generate_category_details(self) -> str:
-        """Generate category details section."""
+    def _generate_category_details(self, out: TextIO) -> None:
+        """Write category details section."""
         categories = self.compliance_data.get('categories', {})
         
-        category_cards = []
+        out.write("""
+        <div class="category-grid">
+            """)
         for name, data in categories.items():
             status = data.get('status', 'UNKNOWN')
             details = data.get('details', '')
             
-            emoji_map = {
-                'functional': '⚙️',
-                'quality': '🎯',
-                'performance': '🚀',
-                'security': '🔒'
-            }
-            
-            status_emoji_map = {
-                'PASS': '✅',
-                'FAIL': '❌',
-                'PARTIAL': '🟡',
-                'PLANNED': '📋',
-                'NOT_TESTED': '⚠️'
-            }
+            emoji = _EMOJI_MAP.get(name, '📋')
+            status_emoji = _STATUS_EMOJI_MAP.get(status, '❓')
             
-            emoji = emoji_map.get(name, '📋')
-            status_emoji = status_emoji_map.get(status, '❓')
-            
-            category_cards.append(f"""
-            <div class="category-card">
-                <h3>{emoji} {name.title()} Requirements {status_emoji}</h3>
-                <p><strong>Status:</strong> {status}</p>
-                <p><strong>Details:</strong> {details}</p>
-            </div>
-            """)
-        
-        return f"""
-        <div class="category-grid">
-            {''.join(category_cards)}
+            out.write(_CATEGORY_CARD_TMPL.format_map({
+                'emoji': emoji,
+                'name_title': name.title(),
+                'status_emoji': status_emoji,
+                'status': status,
+                'details': details
+            }))
+        out.write("""
         </div>
-        """
+        """)
     
-    def _generate_risks_section(self) -> str:
-        """Generate risks section."""
+    def _generate_risks_section(self, out: TextIO) -> None:
+        """Write risks section."""
         risks = self.compliance_data.get('risks', [])
         
         if not risks:
-            return """
+            out.write("""
             <div class="risks-section">
                 <h2>🛡️ Risk Assessment</h2>
                 <p style="color: #2ecc71; font-weight: bold;">✅ No significant risks identified</p>
             </div>
-            """
-        
-        risk_items = []
-        for risk in risks:
-            severity = risk.get('severity', 'medium').lower()
-            severity_emoji = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}.get(severity, '❓')
-            
-            risk_items.append(f"""
-            <div class="risk-item risk-{severity}">
-                <h4>{severity_emoji} {risk.get('title', 'Unknown Risk')}</h4>
-                <p><strong>Severity:</strong> {risk.get('severity', 'Unknown').title()}</p>
-                <p>{risk.get('description', 'No description available')}</p>
-            </div>
             """)
+            return
         
-        return f"""
+        out.write("""
         <div class="risks-section">
             <h2>⚠️ Risk Assessment</h2>
-            {''.join(risk_items)}
+            """)
+        for risk in risks:
+            severity = risk.get('severity', 'medium').lower()
+            severity_emoji = _SEVERITY_EMOJI_MAP.get(severity, '❓')
+            
+            out.write(_RISK_ITEM_TMPL.format_map({
+                'severity': severity,
+                'severity_emoji': severity_emoji,
+                'title': risk.get('title', 'Unknown Risk'),
+                'severity_title': risk.get('severity_title', 'Unknown'),
+                'description': risk.get('description', 'No description available')
+            }))
+        out.write("""
         </div>
-        """
+        """)
     
-    def _generate_recommendations_section(self) -> str:
-        """Generate recommendations section."""
+    def _generate_recommendations_section(self, out: TextIO) -> None:
+        """Write recommendations section."""
         recommendations = self.compliance_data.get('recommendations', [])
         
         if not recommendations:
-            return """
+            out.write("""
             <div class="recommendations-section">
                 <h2>💡 Recommendations</h2>
                 <p style="color: #2ecc71; font-weight: bold;">✅ No specific recommendations at this time</p>
             </div>
-            """
-        
-        rec_items = []
-        for i, rec in enumerate(recommendations, 1):
-            rec_items.append(f"""
-            <div class="recommendation-item">
-                <strong>{i}.</strong> {rec}
-            </div>
             """)
+            return
         
-        return f"""
+        out.write("""
         <div class="recommendations-section">
             <h2>💡 Recommendations</h2>
-            {''.join(rec_items)}
+            """)
+        for i, rec in enumerate(recommendations, 1):
+            out.write(_RECOMMENDATION_ITEM_TMPL.format_map({'index': i, 'text': rec}))
+        out.write("""
         </div>
-        """
+        """)
     
-    def _generate_footer(self) -> str:
-        """Generate footer section."""
-        return """
-        <div class="footer">
-            <p>🤖 Generated automatically by the Tileverse Range Reader requirement verification system</p>
-        </div>
-        """
+    def _generate_footer(self, out: TextIO) -> None:
+        """Write footer section."""
+        out.write(_FOOTER_HTML)
     
-    def _generate_javascript(self) -> str:
-        """Generate JavaScript for charts."""
-        summary = self.compliance_data.get('summary', {})
-        categories = self.compliance_data.get('categories', {})
+    def _generate_javascript(self, out: TextIO) -> None:
+        """Write JavaScript for charts."""
+        data = self.compliance_data
+        summary = data.get('summary', {})
+        categories = data.get('categories', {})
         
         # Prepare data for status chart
+        count = summary.get
         status_data = [
-            summary.get('implemented', 0),
-            summary.get('verified', 0),
-            summary.get('planned', 0),
-            summary.get('not_started', 0)
+            count('implemented', 0),
+            count('verified', 0),
+            count('planned', 0),
+            count('not_started', 0)
         ]
         
         # Prepare data for category chart
         category_labels = list(categories.keys())
-        category_statuses = []
-        for cat_data in categories.values():
-            status = cat_data.get('status', 'UNKNOWN')
-            if status == 'PASS':
-                category_statuses.append(100)
-            elif status == 'FAIL':
-                category_statuses.append(0)
-            elif status == 'PARTIAL':
-                category_statuses.append(50)
-            else:
-                category_statuses.append(25)
-        
-        return f"""
+        category_statuses = [
+            _STATUS_PCT.get(cat_data.get('status', 'UNKNOWN'), 25)
+            for cat_data in categories.values()
+        ]
+        
+        # Embed chart data as JSON rather than relying on Python list repr
+        status_json = json.dumps(status_data, separators=(',', ':'))
+        labels_json = json.dumps(category_labels, separators=(',', ':'))
+        stats_json = json.dumps(category_statuses, separators=(',', ':'))
+        
+        out.write(f"""
         // Status Distribution Chart
         const statusCtx = document.getElementById('statusChart').getContext('2d');
         new Chart(statusCtx, {{
@@ -535,7 +635,7 @@ class DashboardGenerator:
             data: {{
                 labels: ['Implemented', 'Verified', 'Planned', 'Not Started'],
                 datasets: [{{
-                    data: {status_data},
+                    data: {status_json},
                     backgroundColor: [
                         '#2ecc71',
                         '#3498db',
@@ -562,10 +662,10 @@ class DashboardGenerator:
         new Chart(categoryCtx, {{
             type: 'bar',
             data: {{
-                labels: {category_labels},
+                labels: {labels_json},
                 datasets: [{{
                     label: 'Compliance %',
-                    data: {category_statuses},
+                    data: {stats_json},
                     backgroundColor: [
                         '#3498db',
                         '#2ecc71',
@@ -596,7 +696,7 @@ class DashboardGenerator:
                 }}
             }}
         }});
-        """
+        """)
 
 def main():
     parser = argparse.ArgumentParser(description='Generate HTML dashboard from compliance report')